@@ -1,11 +1,6 @@
-# module imports
-from os import makedirs
-from shutil import copytree
-
 # local imports
 from ..module import ModuleBuilder
-from ...common.logger import log
-from ...common.utils import resolve_path
+from ...common.utils import copy_tree, resolve_path
 
 
 class Preferences(ModuleBuilder):
@@ -16,23 +11,13 @@ class Preferences(ModuleBuilder):
 
     def stage(self):
         """Stage a deb to be packaged."""
-        # log
-        log(f"Staging...", "📦", self.module.abbreviated_name, self.luz.lock)
-        # before stage
-        if self.module.before_stage:
-            self.module.before_stage()
-        # dirs to make
-        dirtocopy = self.meta.root_dir / self.module.install_dir
-        # make proper dirs
-        if not dirtocopy.parent.exists():
-            makedirs(dirtocopy.parent, exist_ok=True)
-        copytree(self.dylib_dir, dirtocopy, dirs_exist_ok=True)
+        dirtocopy = self.stage_linked()
         # copy resources
         resources_path = resolve_path(self.module.resources_dir)
         if not resources_path.exists():
             return f'Resources/ folder for "{self.module.name}" does not exist. (path: {resources_path}))'
         # copy resources
-        copytree(resources_path, dirtocopy, dirs_exist_ok=True)
+        copy_tree(resources_path, dirtocopy)
         # after stage
         if self.module.after_stage:
             self.module.after_stage()
@@ -1,13 +1,11 @@
 # module imports
-from concurrent.futures import ThreadPoolExecutor, wait
-from os import makedirs
-from shutil import copytree, rmtree
-from subprocess import check_output
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from os import cpu_count, makedirs, rename, scandir, unlink
 
 # local imports
 from ..common.deps import clone_headers, clone_libraries, logos
 from ..common.logger import log
-from ..common.utils import get_hash, resolve_path
+from ..common.utils import copy_tree, get_hash, resolve_path
 
 
 class ModuleBuilder:
@@ -26,9 +24,13 @@ class ModuleBuilder:
         self.meta = luz.meta
         self.control = luz.control
 
-        # add necessary include files
-        cloned_libs = str(clone_libraries(self.luz))
-        self.module.include_dirs.append(str(clone_headers(self.luz)))
+        # add necessary include files; memoized on the luz object so the
+        # clone-or-check work runs once per build, not once per module
+        if not hasattr(luz, "cloned_headers"):
+            luz.cloned_headers = clone_headers(self.luz)
+            luz.cloned_libraries = clone_libraries(self.luz)
+        cloned_libs = str(luz.cloned_libraries)
+        self.module.include_dirs.append(str(luz.cloned_headers))
         self.module.library_dirs.append(cloned_libs)
         self.module.framework_dirs.append(cloned_libs)
         self.module.include_dirs.append(f"{self.meta.sdk}/usr/include")
@@ -41,11 +43,15 @@ class ModuleBuilder:
         self.module.framework_dirs.append(f"{self.meta.storage}/lib")
 
         # swift
-        for file in self.module.files:
-            if str(file).endswith(".swift"):
-                self.module.library_dirs.append("/usr/lib/swift")
-                self.module.library_dirs.append(f"{self.meta.sdk}/usr/lib/swift")
-                break
+        if any(str(file).endswith(".swift") for file in self.module.files):
+            self.module.library_dirs.append("/usr/lib/swift")
+            self.module.library_dirs.append(f"{self.meta.sdk}/usr/lib/swift")
+
+        # dedupe search paths, preserving order; duplicates make clang re-walk
+        # the same directories on every invocation
+        self.module.include_dirs = list(dict.fromkeys(self.module.include_dirs))
+        self.module.library_dirs = list(dict.fromkeys(self.module.library_dirs))
+        self.module.framework_dirs = list(dict.fromkeys(self.module.framework_dirs))
 
         # private frameworks
         if self.module.private_frameworks != []:
@@ -63,6 +69,10 @@ class ModuleBuilder:
         # fix install dir
         self.module.install_dir = self.module.install_dir.relative_to(self.module.install_dir.anchor)
 
+        # build-time constants
+        self.platform_formatted = "ios" if self.meta.platform == "iphoneos" else self.meta.platform
+        self.version_min = f"-m{self.meta.platform}-version-min={self.meta.min_vers}"
+
         # files
         self.files = self.__hash_files(self.module.files, "executable" if self.module.type == "tool" else "dylib")
 
@@ -72,9 +82,11 @@ class ModuleBuilder:
         :param list files: The list of files to hash.
         :param str type: The type of files to hash.
         """
-        # make dirs
-        if not self.obj_dir.exists():
-            makedirs(self.obj_dir, exist_ok=True)
+        # create every output dir in one sweep
+        needed_dirs = {f"{self.obj_dir}/{arch}" for arch in self.meta.archs}
+        needed_dirs.add(str(self.dylib_dir) if compile_type == "dylib" else str(self.bin_dir))
+        for needed_dir in needed_dirs:
+            makedirs(needed_dir, exist_ok=True)
 
         files_to_compile = []
 
@@ -91,22 +103,43 @@ class ModuleBuilder:
             file_path = resolve_path(file)
             files_to_compile.append(file_path)
 
-        # dylib
-        if compile_type == "dylib":
-            if not self.dylib_dir.exists():
-                makedirs(self.dylib_dir, exist_ok=True)
-        # executable
-        elif compile_type == "executable":
-            if not self.bin_dir.exists():
-                makedirs(self.bin_dir, exist_ok=True)
+        # object-name prefixes for every module source; logos sources build
+        # from their processed .m/.mm counterparts
+        self.object_prefixes = tuple(f"{self.__logos_name(file.name)}-" for file in files_to_compile)
+        # swift sources never pass through logos, so the full set is known
+        # here; cross-file compiles need unchanged swift sources too
+        self.all_swift_paths = [file for file in files_to_compile if str(file).endswith(".swift")]
+
+        # hashlist entries carry stat metadata so unchanged files skip a full
+        # read; entries in an older schema are dropped and rehashed once
+        if self.luz.build_info.get("hash_schema") != 2:
+            self.luz.build_info["hashlist"] = {}
+            self.luz.build_info.pop("hash_cache", None)
+            self.luz.build_info["hash_schema"] = 2
+        hashlist = self.luz.build_info.setdefault("hashlist", {})
+
+        # split stat matches from files that actually need hashing
+        stats = {file: file.stat() for file in files_to_compile}
+        to_hash = []
+        hashes = {}
+        for file in files_to_compile:
+            stat = stats[file]
+            entry = hashlist.get(str(file))
+            if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                hashes[file] = entry["hash"]
+            else:
+                to_hash.append(file)
+
+        # hash the remainder in parallel; hashing is read-bound
+        for file, new_hash in zip(to_hash, self.luz.pool.map(get_hash, to_hash)):
+            hashes[file] = new_hash
 
         # loop files
         for file in files_to_compile:
             # get file hash
-            if "hashlist" not in self.luz.build_info:
-                self.luz.build_info["hashlist"] = {}
-            fhash = self.luz.build_info["hashlist"].get(str(file))
-            new_hash = get_hash(file)
+            entry = hashlist.get(str(file))
+            fhash = entry["hash"] if entry is not None else None
+            new_hash = hashes[file]
             if fhash is None:
                 changed.append(file)
             elif fhash == new_hash:
@@ -118,7 +151,8 @@ class ModuleBuilder:
             elif fhash != new_hash:
                 changed.append(file)
             # add to new hashes
-            new_hashes[str(file)] = new_hash
+            stat = stats[file]
+            new_hashes[str(file)] = {"hash": new_hash, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
 
         # hashes
         self.luz.update_hashlist(new_hashes)
@@ -126,6 +160,12 @@ class ModuleBuilder:
         # files list
         files = changed if self.module.only_compile_changed else files_to_compile
 
+        # pool; bounded by hardware concurrency — more workers than cores
+        # just adds scheduling overhead while everything blocks on the
+        # compiler. Only leaf tasks run here (per-arch compiles and links),
+        # so nothing on this pool ever waits on work queued behind it
+        self.pool = ThreadPoolExecutor(max_workers=min(len(files) * arch_count or 1, (cpu_count() or 4) * 2))
+
         # handle files not needing compilation
         if len(files) == 0:
             log(
@@ -136,15 +176,13 @@ class ModuleBuilder:
             )
             return []
 
-        files = files_to_compile
-
-        # use logos on files
-        if not self.logos_dir.exists() and list(filter(lambda x: ".x" in x, [str(f) for f in files])) != []:
+        # use logos only when there are actual logos sources; the substring
+        # check used here before also matched any path merely containing ".x"
+        if any(str(file).endswith((".x", ".xm")) for file in files):
             makedirs(self.logos_dir, exist_ok=True)
-        files = logos(self.luz, self.module, files)
-
-        # pool
-        self.pool = ThreadPoolExecutor(max_workers=(len(files) * arch_count))
+            files = logos(self.luz, self.module, files)
+        else:
+            files = [{"logos": False, "path": file} for file in files]
 
         # return files
         return files
@@ -172,63 +210,85 @@ class ModuleBuilder:
         )
 
         # build args
-        build_flags = [
-            "-fobjc-arc" if self.module.use_arc else "",
-            f"-isysroot {self.meta.sdk}",
-            f"-O{self.module.optimization}",
-            ("-I" + " -I".join(self.module.include_dirs)) if self.module.include_dirs != [] else "",
-            ("-L" + " -L".join(self.module.library_dirs)) if self.module.library_dirs != [] else "",
-            ("-F" + " -F".join(self.module.framework_dirs)) if self.module.framework_dirs != [] else "",
-            ("-l" + " -l".join(self.module.libraries)) if self.module.libraries != [] else "",
-            ("-framework " + " -framework ".join(self.module.frameworks)) if self.module.frameworks != [] else "",
-            ("-framework " + " -framework ".join(self.module.private_frameworks)) if self.module.private_frameworks != [] else "",
-            f"-m{self.meta.platform}-version-min={self.meta.min_vers}",
-            "-g" if self.meta.debug else "",
-            f"-Wl,-install_name,{'/var/jb' if self.meta.rootless else ''}/{self.module.install_dir}/{self.module.install_name},-rpath,{'/var/jb' if self.meta.rootless else ''}/usr/lib/,-rpath,{'/var/jb' if self.meta.rootless else ''}/Library/Frameworks/",
-        ]
+        build_flags = []
+        if self.module.use_arc:
+            build_flags.append("-fobjc-arc")
+        build_flags += ["-isysroot", str(self.meta.sdk)]
+        build_flags.append(f"-O{self.module.optimization}")
+        build_flags += [f"-I{directory}" for directory in self.module.include_dirs]
+        build_flags += [f"-L{directory}" for directory in self.module.library_dirs]
+        build_flags += [f"-F{directory}" for directory in self.module.framework_dirs]
+        build_flags += [f"-l{library}" for library in self.module.libraries]
+        # objc++/c++ sources need the c++ runtime at link time
+        if any(str(file).endswith((".mm", ".xm", ".cpp", ".cc", ".cxx")) for file in self.module.files):
+            build_flags.append("-lc++")
+        for framework in self.module.frameworks + self.module.private_frameworks:
+            build_flags += ["-framework", framework]
+        build_flags.append(self.version_min)
+        if self.meta.debug:
+            build_flags.append("-g")
+        build_flags.append(f"-Wl,-install_name,{'/var/jb' if self.meta.rootless else ''}/{self.module.install_dir}/{self.module.install_name},-rpath,{'/var/jb' if self.meta.rootless else ''}/usr/lib/,-rpath,{'/var/jb' if self.meta.rootless else ''}/Library/Frameworks/")
         build_flags.extend(self.module.warnings)
         build_flags.extend(self.module.linker_flags)
         # add dynamic lib to args
         if compile_type == "dylib":
             build_flags.append("-dynamiclib")
-        # compile for each arch
-        # format platform
-        platform = "ios" if self.meta.platform == "iphoneos" else self.meta.platform
-        for arch in self.meta.archs:
-            try:
-                # strings
-                strings = []
-                for file in resolve_path(f"{self.obj_dir}/{arch}/*.o"):
-                    strings.append(str(file))
-                # arch
-                arch_formatted = f"-target {arch}-apple-{platform}{self.meta.min_vers}"
-                self.luz.cmd.exec_output(f"{self.meta.cc} {' '.join(strings)} -o {self.obj_dir}/{arch}/{self.module.install_name} {' '.join(build_flags)} {arch_formatted}")
-            except Exception as e:
-                print(e)
-                return f'An error occured when trying to link files for module "{self.module.name}" for architecture "{arch}".'
-
-        # link
+        # link each arch concurrently; the per-arch links are independent
+        futures = [self.pool.submit(self.__link_arch, arch, build_flags) for arch in self.meta.archs]
+        link_error = self.wait_first_error(futures)
+        if link_error is not None:
+            return link_error
+
+        # link; argv lists skip the shell, and unlike the old getoutput-based
+        # calls a failing tool actually raises here
         try:
             compiled = [f"{self.obj_dir}/{arch}/{self.module.install_name}" for arch in self.meta.archs]
-            self.luz.cmd.exec_no_output(f"{self.meta.lipo} -create -output {out_name} {' '.join(compiled)}")
+            self.luz.cmd.exec_output([self.meta.lipo, "-create", "-output", out_name, *compiled])
         except:
             return f'An error occured when trying to lipo files for module "{self.module.name}".'
 
+        return self.__sign(out_name, compile_type)
+
+    def __sign(self, out_name, compile_type: str):
+        """Post-process a linked artifact: strip release executables, then
+        codesign.
+
+        :param Path out_name: The linked artifact.
+        :param str compile_type: The type of artifact that was linked.
+        """
         if compile_type == "executable" and self.meta.release:
             try:
-                self.luz.cmd.exec_no_output(f"{self.meta.strip} {out_name}")
+                self.luz.cmd.exec_output([self.meta.strip, out_name])
             except:
                 return f'An error occured when trying to strip "{out_name}" for module "{self.module.name}".'
 
         try:
             # run ldid
-            self.luz.cmd.exec_no_output(f"{self.meta.ldid} {' '.join(self.module.codesign_flags)} {out_name}")
+            self.luz.cmd.exec_output([self.meta.ldid, *self.module.codesign_flags, out_name])
         except:
             return f'An error occured when trying codesign "{out_name}" for module "{self.module.name}".'
 
+    def __link_arch(self, arch: str, build_flags: list):
+        """Link the compiled objects for a single architecture.
+
+        :param str arch: The architecture to link for.
+        :param list build_flags: The shared linker flags.
+        """
+        try:
+            # objects of unchanged files found during the prune pass, plus
+            # whatever the compile step produced this run
+            strings = self.objs_by_arch[arch]
+            # arch
+            args = [self.meta.cc, *strings, "-o", f"{self.obj_dir}/{arch}/{self.module.install_name}", *build_flags, *self.arch_targets[arch]]
+            self.luz.cmd.exec_output(args)
+        except Exception as e:
+            print(e)
+            return f'An error occured when trying to link files for module "{self.module.name}" for architecture "{arch}".'
+
     def __handle_logos(self):
         """Handle files that have had Logos ran on them."""
         self.files_paths = []
+        included = set(self.module.include_dirs)
         for file in self.files:
             new_path = ""
             # handle logos files
@@ -240,7 +300,8 @@ class ModuleBuilder:
                 # include path
                 include_path = "/".join(str(orig_path).split("/")[:-1])
                 # add it to include if it's not already there
-                if include_path not in self.module.include_dirs:
+                if include_path not in included:
+                    included.add(include_path)
                     self.module.include_dirs.append(include_path)
             # handle normal files
             else:
@@ -249,117 +310,161 @@ class ModuleBuilder:
             # add to files paths
             self.files_paths.append(new_path)
 
-    def __compile_file(self, file):
-        # log
-        if file.get("old_path") is not None:
-            file_formatted = str(file.get("old_path")).replace(str(self.luz.path.absolute()), "")
-            if file_formatted != str(file.get("old_path")):
-                file_formatted = "/".join(file_formatted.split("/")[1:])
-            msg = f'Compiling "{file_formatted}"...'
-        else:
-            file_formatted = str(file.get("path")).replace(str(self.luz.path.absolute()), "")
-            if file_formatted != str(file.get("path")):
-                file_formatted = "/".join(file_formatted.split("/")[1:])
-            msg = f'Compiling "{file_formatted}"...'
-
-        log(msg, "🔨", self.module.abbreviated_name, self.luz.lock)
-
-        file = list(
-            filter(
-                lambda x: x == file.get("new_path") or x == file.get("path"),
-                self.files_paths,
-            )
-        )[0]
-
-        # compile file
-        try:
-            if str(file).endswith(".swift"):
-                files_minus_to_compile = list(
-                    filter(
-                        lambda x: x != file and str(x).endswith(".swift"),
-                        self.files_paths,
-                    )
-                )
-                fmtc = [str(x) for x in files_minus_to_compile]
-                futures = [self.pool.submit(self.__compile_swift_arch, file, fmtc, x) for x in self.meta.archs]
-            else:
-                futures = [self.pool.submit(self.__compile_c_arch, file, x) for x in self.meta.archs]
-            self.wait(futures)
-
-            # check results
-            for future in futures:
-                if future.result() is not None:
-                    return f'An error occured when attempting to compile for module "{self.module.name}".'
-
-        except:
-            return f'An error occured when attempting to compile for module "{self.module.name}".'
+        # swift sources, collected once for the per-file compile fan-out
+        self.swift_paths = self.all_swift_paths
+
+    @staticmethod
+    def __logos_name(name: str) -> str:
+        """Map a source file name to the name its objects are built from."""
+        if name.endswith(".x"):
+            return f"{name}.m"
+        if name.endswith(".xm"):
+            return f"{name}.mm"
+        return name
+
+    def __prepare_flags(self):
+        """Precompute the flag fragments shared by every compile invocation."""
+        self.arch_targets = {arch: ["-target", f"{arch}-apple-{self.platform_formatted}{self.meta.min_vers}"] for arch in self.meta.archs}
+        # clang flags shared by every (file, arch) pair
+        c_flags = []
+        if self.module.use_arc:
+            c_flags.append("-fobjc-arc")
+        c_flags += ["-isysroot", str(self.meta.sdk)]
+        c_flags.append(f"-O{self.module.optimization}")
+        c_flags += [f"-I{directory}" for directory in self.module.include_dirs]
+        c_flags.append(self.version_min)
+        if self.meta.debug:
+            c_flags.append("-g")
+        if self.control:
+            c_flags.append(f'-DLUZ_PACKAGE_VERSION="{self.control.version}"')
+        c_flags.append(f'-DLUZ_INSTALL_PREFIX="/var/jb"' if self.meta.rootless else '-DLUZ_INSTALL_PREFIX=""')
+        c_flags.extend(self.__rebase_flag(flag) for flag in self.module.c_flags)
+        c_flags.extend(self.module.warnings)
+        self.c_flags_by_arch = {arch: [self.meta.cc, *c_flags, *self.arch_targets[arch]] for arch in self.meta.archs}
+        # swift flags shared by every (file, arch) pair
+        swift_flags = ["-frontend", "-c"]
+        swift_flags += ["-module-name", self.module.name]
+        swift_flags += ["-sdk", str(self.meta.sdk)]
+        swift_flags += [f"-I{directory}" for directory in self.module.include_dirs]
+        for header in self.module.bridging_headers:
+            swift_flags += ["-import-objc-header", str(header)]
+        if self.meta.debug:
+            swift_flags.append("-g")
+        swift_flags.extend(self.module.swift_flags)
+        self.swift_flags_by_arch = {arch: [self.meta.swift, *swift_flags, *self.arch_targets[arch]] for arch in self.meta.archs}
+
+    def __log_compiling(self, file):
+        """Log that a file is being compiled."""
+        orig_path = file.get("old_path") or file.get("path")
+        file_formatted = str(orig_path).replace(str(self.luz.path.absolute()), "")
+        if file_formatted != str(orig_path):
+            file_formatted = "/".join(file_formatted.split("/")[1:])
+        log(f'Compiling "{file_formatted}"...', "🔨", self.module.abbreviated_name, self.luz.lock)
+
+    def __rebase_flag(self, flag: str) -> str:
+        """Rebase a flag that names a project-relative path.
+
+        Batched compiles run inside the per-arch object dir rather than the
+        project dir, so relative paths in user c_flags would dangle.
+
+        :param str flag: The flag to rebase.
+        """
+        for prefix in ("-I", "-L", "-F", ""):
+            value = flag[len(prefix):]
+            if flag.startswith(prefix) and value and not value.startswith(("/", "-")) and (self.luz.path / value).exists():
+                return f"{prefix}{(self.luz.path / value).absolute()}"
+        return flag
 
     def __compile_swift_arch(self, file, fmtc: list, arch: str):
-        # format platform
-        platform = "ios" if self.meta.platform == "iphoneos" else self.meta.platform
-        # arch
-        arch_formatted = f"-target {arch}-apple-{platform}{self.meta.min_vers}"
         # outname
         out_name = f"{self.obj_dir}/{arch}/{file.name}-{self.luz.now}"
         # define build flags
-        build_flags = [
-            "-frontend",
-            "-c",
-            f"-module-name {self.module.name}",
-            f'-sdk "{self.meta.sdk}"',
-            ("-I" + " -I".join(self.module.include_dirs)) if self.module.include_dirs != [] else "",
-            ("-import-objc-header" + " -import-objc-header".join(self.module.bridging_headers)) if self.module.bridging_headers != [] else "",
-            arch_formatted,
-            f"-emit-module-path {out_name}.swiftmodule",
-            f"-o {out_name}.o",
-            "-g" if self.meta.debug else "",
-            "-primary-file",
-        ]
-        build_flags.extend(self.module.swift_flags)
-        rmtree(
-            f"{self.obj_dir}/{arch}/{file.name}-*",
-            ignore_errors=True,
-        )
+        args = list(self.swift_flags_by_arch[arch])
+        args += ["-emit-module-path", f"{out_name}.swiftmodule"]
+        args += ["-o", f"{out_name}.o"]
+        args += ["-primary-file", str(file), *fmtc]
         # compile with swift using build flags
         try:
-            self.luz.cmd.exec_output(f"{self.meta.swift} {' '.join(build_flags)} {file} {' '.join(fmtc)}")
+            self.luz.cmd.exec_output(args)
+            self.objs_by_arch[arch].append(f"{out_name}.o")
         except:
             return f'An error occured when trying to compile "{file}" for module "{self.module.name}".'
 
+    def __compile_swift_batch(self, arch: str):
+        """Compile every swift source for one architecture in a single
+        whole-module invocation.
+
+        :param str arch: The architecture to compile for.
+        """
+        out_name = f"{self.obj_dir}/{arch}/{self.module.name}.swift-{self.luz.now}"
+        args = list(self.swift_flags_by_arch[arch])
+        args += ["-emit-module-path", f"{out_name}.swiftmodule"]
+        args += ["-o", f"{out_name}.o"]
+        args += [str(path) for path in self.swift_paths]
+        # compile with swift using build flags
+        try:
+            self.luz.cmd.exec_output(args)
+            self.objs_by_arch[arch].append(f"{out_name}.o")
+        except:
+            return f'An error occured when trying to compile for module "{self.module.name}".'
+
     def __compile_c_arch(self, file, arch: str):
-        # format platform
-        platform = "ios" if self.meta.platform == "iphoneos" else self.meta.platform
-        # arch
-        arch_formatted = f"-target {arch}-apple-{platform}{self.meta.min_vers}"
-        # outname
+        """Compile a single c-family file for one architecture; used when a
+        batched compile would collide on the emitted object name.
+
+        :param Path file: The file to compile.
+        :param str arch: The architecture to compile for.
+        """
         out_name = f"{self.obj_dir}/{arch}/{file.name}-{self.luz.now}.o"
-        build_flags = [
-            "-fobjc-arc" if self.module.use_arc else "",
-            f"-isysroot {self.meta.sdk}",
-            f"-O{self.module.optimization}",
-            arch_formatted,
-            ("-I" + " -I".join(self.module.include_dirs)) if self.module.include_dirs != [] else "",
-            f"-m{self.meta.platform}-version-min={self.meta.min_vers}",
-            "-g" if self.meta.debug else "",
-            f"-o {out_name}",
-            f'-DLUZ_PACKAGE_VERSION=\\"{self.control.version}\\"' if self.control else "",
-            f'-DLUZ_INSTALL_PREFIX=\\"/var/jb\\"' if self.meta.rootless else f'-DLUZ_INSTALL_PREFIX=\\"\\"',
-            "-c",
-        ]
-        build_flags.extend(self.module.c_flags)
-        build_flags.extend(self.module.warnings)
-        rmtree(
-            f"{self.obj_dir}/{arch}/{file.name}-*",
-            ignore_errors=True,
-        )
+        args = list(self.c_flags_by_arch[arch])
+        args += ["-o", out_name]
+        args += ["-c", str(file)]
         # compile with clang using build flags
         try:
-            self.luz.cmd.exec_output(f"{self.meta.cc} {' '.join(build_flags)} {file}")
+            self.luz.cmd.exec_output(args)
+            self.objs_by_arch[arch].append(out_name)
         except:
             return f'An error occured when attempting to compile "{file}" for module "{self.module.name}".'
 
-    def __stage(self):
-        """Stage a generic deb to be packaged."""
+    def __compile_c_batch(self, files, arch: str):
+        """Compile every c-family file for one architecture in a single clang
+        invocation, amortizing the driver and SDK-header startup cost.
+
+        :param list files: The files to compile.
+        :param str arch: The architecture to compile for.
+        """
+        arch_dir = f"{self.obj_dir}/{arch}"
+        args = list(self.c_flags_by_arch[arch])
+        # the batch runs inside the arch dir, so relative source paths (the
+        # logos-processed files under .luz) must be absolutized first
+        args += ["-c", *[str(resolve_path(file).absolute()) for file in files]]
+        # compile with clang using build flags; clang drops each object next
+        # to the cwd, so rename them into the timestamped scheme afterwards
+        try:
+            self.luz.cmd.exec_output(args, cwd=arch_dir)
+            for file in files:
+                out_name = f"{arch_dir}/{file.name}-{self.luz.now}.o"
+                rename(f"{arch_dir}/{file.stem}.o", out_name)
+                self.objs_by_arch[arch].append(out_name)
+        except:
+            return f'An error occured when attempting to compile for module "{self.module.name}".'
+
+    def publish(self, linked, dirtocopy):
+        """Publish a linked directory into the staging tree.
+
+        :param Path linked: The directory holding the linked output.
+        :param Path dirtocopy: The staging destination.
+        """
+        # hardlinks cost one inode op per file without duplicating the
+        # artifact bytes, and — unlike a rename — leave the linked output in
+        # the build dir for the linker's warm-rebuild check
+        copy_tree(linked, dirtocopy, hardlink=True)
+
+    def stage_linked(self):
+        """Stage the linked output into the deb tree.
+
+        :return: The staging destination.
+        """
         # log
         log(f"Staging...", "📦", self.module.abbreviated_name, self.luz.lock)
         # before stage
@@ -368,12 +473,16 @@ class ModuleBuilder:
         # dirs to make
         dirtocopy = self.meta.root_dir / self.module.install_dir
         # make proper dirs
-        if not dirtocopy.parent.exists():
-            makedirs(dirtocopy.parent, exist_ok=True)
+        makedirs(dirtocopy.parent, exist_ok=True)
         # dir of linked file
         if self.module.type == "tool": linked = self.bin_dir
         else: linked = self.dylib_dir
-        copytree(linked, dirtocopy, dirs_exist_ok=True)
+        self.publish(linked, dirtocopy)
+        return dirtocopy
+
+    def __stage(self):
+        """Stage a generic deb to be packaged."""
+        self.stage_linked()
         # after stage
         if self.module.after_stage:
             self.module.after_stage()
@@ -382,17 +491,63 @@ class ModuleBuilder:
         """Compile module."""
         # handle logos
         self.__handle_logos()
-        # clean arch dirs
+        # flags; computed after logos since it can add include dirs
+        self.__prepare_flags()
+        # prune stale objects: anything for a file being recompiled, plus
+        # orphans whose source left the module; objects of unchanged files
+        # survive the pass and are carried straight to the linker
+        self.objs_by_arch = {}
+        recompiling = tuple(f"{x.name}-" for x in self.files_paths)
         for arch in self.meta.archs:
-            for x in self.files_paths:
-                check_output(f"rm -rf {self.obj_dir}/{arch}/{x.name}-*", shell=True)
-            makedirs(f"{self.obj_dir}/{arch}", exist_ok=True)
-        # compile files
-        futures = [self.luz.pool.submit(self.__compile_file, file) for file in self.files]
-        self.wait(futures)
-        for result in futures:
-            if result.result() is not None:
-                return result.result()
+            kept = []
+            with scandir(f"{self.obj_dir}/{arch}") as entries:
+                for entry in entries:
+                    if entry.name == self.module.install_name:
+                        continue
+                    if entry.name.startswith(recompiling) or not entry.name.startswith(self.object_prefixes):
+                        unlink(entry.path)
+                    elif entry.name.endswith(".o"):
+                        kept.append(entry.path)
+            self.objs_by_arch[arch] = kept
+        # compile files; swift sources fan out per file, c-family sources are
+        # batched so the clang driver starts once per arch instead of per file
+        swift_files = []
+        c_paths = []
+        for file in self.files:
+            if str(file.get("new_path") or file.get("path")).endswith(".swift"):
+                swift_files.append(file)
+            else:
+                self.__log_compiling(file)
+                c_paths.append(file.get("new_path") or file.get("path"))
+        if swift_files and not self.module.only_compile_changed:
+            # with incrementality off there is nothing to gain from per-file
+            # primaries, which re-parse every sibling source N times; compile
+            # the whole swift module in one frontend per arch instead
+            for file in swift_files:
+                self.__log_compiling(file)
+            futures = [self.pool.submit(self.__compile_swift_batch, arch) for arch in self.meta.archs]
+        else:
+            futures = []
+            for file in swift_files:
+                self.__log_compiling(file)
+                path = file.get("new_path") or file.get("path")
+                fmtc = [str(x) for x in self.swift_paths if x != path]
+                futures += [self.pool.submit(self.__compile_swift_arch, path, fmtc, arch) for arch in self.meta.archs]
+        if c_paths:
+            # files sharing a stem (foo.c + foo.m) would overwrite each
+            # other's objects inside one batched invocation, since clang
+            # names every output <stem>.o; compile those individually
+            by_stem = {}
+            for path in c_paths:
+                by_stem.setdefault(path.stem, []).append(path)
+            batched = [paths[0] for paths in by_stem.values() if len(paths) == 1]
+            colliding = [path for paths in by_stem.values() if len(paths) > 1 for path in paths]
+            if batched:
+                futures += [self.pool.submit(self.__compile_c_batch, batched, arch) for arch in self.meta.archs]
+            futures += [self.pool.submit(self.__compile_c_arch, path, arch) for path in colliding for arch in self.meta.archs]
+        compile_error = self.wait_first_error(futures)
+        if compile_error is not None:
+            return compile_error
         # link files
         # get compile type
         compile_type = "executable" if self.module.type == "tool" else "dylib"
@@ -409,5 +564,18 @@ class ModuleBuilder:
             if stage_result is not None:
                 return stage_result
 
-    def wait(self, thread):
-        wait(thread)
+    def wait_first_error(self, futures):
+        """Wait on futures, returning the first error result.
+
+        Remaining futures are cancelled so a failing build stops at the first
+        error instead of waiting out the slowest task; already-running tasks
+        still finish.
+
+        :param list futures: The futures to wait on.
+        """
+        for future in as_completed(futures):
+            result = future.result()
+            if result is not None:
+                for remaining in futures:
+                    remaining.cancel()
+                return result
@@ -1,11 +1,18 @@
 # module imports
 from os import makedirs
 from pathlib import Path
+from threading import Lock
 
 # local imports
 from .logger import error, log_stdout, remove_log_stdout
 from .utils import resolve_path
 
+# cloned vendor dirs keyed by (kind, storage); shared across every Luz in a
+# process so non-inheriting submodules don't repeat the clone-or-check work.
+# the lock keeps concurrent builders from racing the same git clone
+_cloned = {}
+_clone_lock = Lock()
+
 
 def clone_logos(module, update: bool = False) -> Path:
     """Clones logos.
@@ -17,20 +24,25 @@ def clone_logos(module, update: bool = False) -> Path:
     logos_url = "https://github.com/LuzProject/logos"
     storage = module.meta.storage
     # logos path
-    logos_path = resolve_path(f"{storage}/vendor/logos")
-    # if it doesn't exist, clone logos
-    if not logos_path.exists():
-        log_stdout("Cloning logos...")
-        makedirs(logos_path.parent, exist_ok=True)
-        module.cmd.exec_no_output(f"{module.meta.git} clone {logos_url} {logos_path} --recursive")
-        remove_log_stdout("Cloning logos...")
-    # update
-    if update:
-        log_stdout("Updating logos...")
-        module.cmd.exec_no_output(f"cd {logos_path} && {module.meta.git} pull")
-        remove_log_stdout("Updating logos...")
-    # return path
-    return logos_path
+    key = ("logos", str(storage))
+    with _clone_lock:
+        if not update and key in _cloned:
+            return _cloned[key]
+        logos_path = resolve_path(f"{storage}/vendor/logos")
+        # if it doesn't exist, clone logos
+        if not logos_path.exists():
+            log_stdout("Cloning logos...")
+            makedirs(logos_path.parent, exist_ok=True)
+            module.cmd.exec_no_output([module.meta.git, "clone", logos_url, logos_path, "--recursive"])
+            remove_log_stdout("Cloning logos...")
+        # update
+        if update:
+            log_stdout("Updating logos...")
+            module.cmd.exec_no_output([module.meta.git, "-C", logos_path, "pull"])
+            remove_log_stdout("Updating logos...")
+        # return path
+        _cloned[key] = logos_path
+        return logos_path
 
 
 def clone_libraries(module, update: bool = False) -> Path:
@@ -40,23 +52,28 @@ def clone_libraries(module, update: bool = False) -> Path:
     :param bool update: Whether to update libraries or not.
     :return: Path to libraries dir
     """
-    libraries_url = "--branch rootless https://github.com/elihwyma/lib"
+    libraries_url = "https://github.com/elihwyma/lib"
     storage = module.meta.storage
     # libraries path
-    libraries_path = resolve_path(f"{storage}/vendor/lib")
-    # if it doesn't exist, clone logos
-    if not libraries_path.exists():
-        log_stdout("Cloning libraries...")
-        makedirs(libraries_path.parent, exist_ok=True)
-        module.cmd.exec_no_output(f"{module.meta.git} clone {libraries_url} {libraries_path} --recursive")
-        remove_log_stdout("Cloning libraries...")
-    # update
-    if update:
-        log_stdout("Updating libraries...")
-        module.cmd.exec_no_output(f"cd {libraries_path} && {module.meta.git} pull")
-        remove_log_stdout("Updating libraries...")
-    # return path
-    return libraries_path
+    key = ("lib", str(storage))
+    with _clone_lock:
+        if not update and key in _cloned:
+            return _cloned[key]
+        libraries_path = resolve_path(f"{storage}/vendor/lib")
+        # if it doesn't exist, clone logos
+        if not libraries_path.exists():
+            log_stdout("Cloning libraries...")
+            makedirs(libraries_path.parent, exist_ok=True)
+            module.cmd.exec_no_output([module.meta.git, "clone", "--branch", "rootless", libraries_url, libraries_path, "--recursive"])
+            remove_log_stdout("Cloning libraries...")
+        # update
+        if update:
+            log_stdout("Updating libraries...")
+            module.cmd.exec_no_output([module.meta.git, "-C", libraries_path, "pull"])
+            remove_log_stdout("Updating libraries...")
+        # return path
+        _cloned[key] = libraries_path
+        return libraries_path
 
 
 def clone_headers(module, update: bool = False) -> Path:
@@ -69,20 +86,25 @@ def clone_headers(module, update: bool = False) -> Path:
     headers_url = "https://github.com/theos/headers"
     storage = module.meta.storage
     # headers path
-    headers_path = resolve_path(f"{storage}/vendor/headers")
-    # if it doesn't exist, clone logos
-    if not headers_path.exists():
-        log_stdout("Cloning headers...")
-        makedirs(headers_path.parent, exist_ok=True)
-        module.cmd.exec_no_output(f"{module.meta.git} clone {headers_url} {headers_path} --recursive")
-        remove_log_stdout("Cloning headers...")
-    # update
-    if update:
-        log_stdout("Updating headers...")
-        module.cmd.exec_no_output(f"cd {headers_path} && {module.meta.git} pull")
-        remove_log_stdout("Updating headers...")
-    # return path
-    return headers_path
+    key = ("headers", str(storage))
+    with _clone_lock:
+        if not update and key in _cloned:
+            return _cloned[key]
+        headers_path = resolve_path(f"{storage}/vendor/headers")
+        # if it doesn't exist, clone logos
+        if not headers_path.exists():
+            log_stdout("Cloning headers...")
+            makedirs(headers_path.parent, exist_ok=True)
+            module.cmd.exec_no_output([module.meta.git, "clone", headers_url, headers_path, "--recursive"])
+            remove_log_stdout("Cloning headers...")
+        # update
+        if update:
+            log_stdout("Updating headers...")
+            module.cmd.exec_no_output([module.meta.git, "-C", headers_path, "pull"])
+            remove_log_stdout("Updating headers...")
+        # return path
+        _cloned[key] = headers_path
+        return headers_path
 
 
 def logos(luz, module, files: list) -> list:
@@ -106,7 +128,7 @@ def logos(luz, module, files: list) -> list:
         # match to case
         file_formatted = str(file).split("/")[-1].split(".")[-1]
         if file_formatted == "x" or file_formatted == "xm":
-            output_value = luz.cmd.exec_no_output(f"{logos_exec} {file}")
+            output_value = luz.cmd.exec_no_output([logos_exec, file])
             output_file = resolve_path(f"{output}.{'m' if file_formatted == 'x' else 'mm'}")
             spl = output_value.splitlines()
             if not spl[0].startswith("#"):
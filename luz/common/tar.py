@@ -73,7 +73,6 @@ class TAR:
         if not resolve_path(archive_name).exists():
             raise Exception(f"Specified archive {archive_name} does not exist.")
         # create out dir if it doesn't exist
-        if not resolve_path(out_dir).exists():
-            makedirs(out_dir)
+        makedirs(out_dir, exist_ok=True)
         # decompress
         getoutput(f"{self.tar} -xf {archive_name} -C {out_dir}")
@@ -1,10 +1,16 @@
 # module imports
-from hashlib import md5
-from os import environ, getcwd, mkdir
+from functools import lru_cache
+from hashlib import blake2b
+
+try:
+    from hashlib import file_digest
+except ImportError:  # Python < 3.11
+    file_digest = None
+from os import X_OK, access, environ, getcwd, link, makedirs, pathsep, scandir, unlink
 from pathlib import Path
 from pkg_resources import get_distribution
-from shutil import which
-from subprocess import check_output, getoutput
+from shutil import SameFileError, copy2, which
+from subprocess import PIPE, STDOUT, check_output, getoutput, run
 from typing import Union
 
 # local imports
@@ -17,111 +23,77 @@ class CMD:
         self.lock = lock
         self.show_messages = show_messages
 
-    def exec_no_output(self, cmd: str) -> str:
+    def exec_no_output(self, cmd) -> str:
         """Execute a command.
 
-        :param str cmd: The command to execute.
+        :param cmd: The command to execute, either an argv list or a shell string.
         :param str cwd: The directory to execute the command in.
         :param bool show_messages: Whether to show the command output.
         :return: The output of the command.
         """
+        if isinstance(cmd, list):
+            cmd = [str(c) for c in cmd]
         if self.show_messages:
+            message = cmd if isinstance(cmd, str) else " ".join(cmd)
             if self.lock is not None:
                 with self.lock:
-                    print(cmd)
+                    print(message)
             else:
-                print(cmd)
-        return getoutput(cmd)
+                print(message)
+        if isinstance(cmd, str):
+            return getoutput(cmd)
+        output = run(cmd, stdout=PIPE, stderr=STDOUT, env=environ.copy(), text=True).stdout
+        return output[:-1] if output.endswith("\n") else output
 
-    def exec_output(self, cmd: str, cwd: str = None):
+    def exec_output(self, cmd, cwd: str = None):
         """Execute a command.
 
-        :param str cmd: The command to execute.
+        :param cmd: The command to execute, either an argv list or a shell string.
         :param str cwd: The directory to execute the command in.
         :param bool show_messages: Whether to show the command output.
         """
         if cwd is None:
             cwd = getcwd()
+        if isinstance(cmd, list):
+            cmd = [str(c) for c in cmd]
         if self.show_messages:
+            message = cmd if isinstance(cmd, str) else " ".join(cmd)
             if self.lock is not None:
                 with self.lock:
-                    print(cmd)
+                    print(message)
             else:
-                print(cmd)
-        if self.lock is not None:
-            with self.lock:
-                check_output(cmd, cwd=cwd, env=environ.copy(), shell=True)
-        else:
-            check_output(cmd, cwd=cwd, env=environ.copy(), shell=True)
+                print(message)
+        # the lock only guards console output; holding it across the actual
+        # subprocess would serialize every compile in the pool
+        check_output(cmd, cwd=cwd, env=environ.copy(), shell=isinstance(cmd, str))
 
 
-def resolve_path(path: str):
-    """Resolve a Path from a String."""
+@lru_cache(maxsize=4096)
+def _resolve_single(path: str) -> Path:
+    """Resolve a non-glob path string to a Path.
+
+    :param str path: The path to resolve.
+    """
     # format env vars in path
-    if "$" in str(path):
+    if "$" in path:
         path = format_path(path)
     # get path
-    p = Path(path).expanduser()
-    # handle globbing
-    if "*" in str(path):
+    return Path(path).expanduser()
+
+
+def resolve_path(path: str):
+    """Resolve a Path from a String."""
+    path = str(path)
+    # handle globbing; the filesystem can change between calls, so this
+    # branch is never cached
+    if "*" in path:
+        if "$" in path:
+            path = format_path(path)
         p = Path(path)
         parts = p.parts[1:] if p.is_absolute() else p.parts
         return list(Path(p.root).expanduser().glob(str(Path("").joinpath(*parts))))
     # return path
-    return p
-
-
-def chained_dict_get(dictionary, key: str):
-    """Get a value nested in a dictionary by its nested path.
-
-    :param dict dictionary: Dictionary to operate on.
-    :param str key: The key to get.
-    :return: The value of the key.
-    """
-    value_path = key.split(".")
-    dict_chain = dictionary
-    while value_path:
-        try:
-            dict_chain = dict_chain.get(value_path.pop(0))
-        except AttributeError:
-            return None
-    return dict_chain
-
-
-def get_from_default(luzbuild, key):
-    """Get the specified value from the default config file.
-
-    :param LuzBuild luzbuild: The LuzBuild class.
-    :param str key: The key to get.
-    :return: The value of the key.
-    """
-    return chained_dict_get(luzbuild.defaults, key)
-
-
-def get_from_luzbuild(luzbuild, key):
-    """Get the specified value from the LuzBuild config file.
-
-    :param LuzBuild luzbuild: The LuzBuild class.
-    :param str key: The key to get.
-    :return: The value of the key.
-    """
-    return chained_dict_get(luzbuild.luzbuild, key)
-
-
-def get_from_cfg(luzbuild, key, default_look_path: str = None):
-    """Get the specified value from either the LuzBuild or the default config file.
-
-    :param LuzBuild luzbuild: The LuzBuild class.
-    :param str key: The key to get.
-    :param str default_look_path: The path to look for in the default config file. Defaults to the value of `key`.
-    :return: The value of the key."""
-    value = get_from_luzbuild(luzbuild, key)
-    if value is None:
-        if default_look_path is not None:
-            value = get_from_default(luzbuild, default_look_path)
-        else:
-            value = get_from_default(luzbuild, key)
-    return value
+    return _resolve_single(path)
 
 
 def format_path(file: str) -> str:
@@ -139,35 +111,103 @@ def format_path(file: str) -> str:
     return new_file
 
 
+def copy_tree(src, dst, hardlink: bool = False):
+    """Copy a directory tree with a single scandir pass per directory.
+
+    Unlike shutil.copytree this reuses each entry's cached stat instead of
+    re-statting source and destination separately, and merges into an
+    existing destination.
+
+    :param src: The source directory.
+    :param dst: The destination directory; created if missing.
+    :param bool hardlink: Hardlink files instead of copying their bytes,
+        falling back to a copy when linking isn't possible.
+    """
+    makedirs(dst, exist_ok=True)
+    with scandir(src) as entries:
+        for entry in entries:
+            target = f"{dst}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                copy_tree(entry.path, target, hardlink)
+            elif entry.is_symlink():
+                # symlinks are recreated rather than followed, and os.symlink
+                # can't overwrite — drop the stale target first when merging
+                try:
+                    unlink(target)
+                except FileNotFoundError:
+                    pass
+                copy2(entry.path, target, follow_symlinks=False)
+            elif hardlink:
+                try:
+                    link(entry.path, target)
+                except OSError:
+                    # an earlier run may have linked this entry into place
+                    # already; anything else falls back to a byte copy
+                    try:
+                        copy2(entry.path, target, follow_symlinks=False)
+                    except SameFileError:
+                        pass
+            else:
+                copy2(entry.path, target, follow_symlinks=False)
+
+
 def get_hash(filepath: str):
     """Gets the hash of a specified file.
 
     :param str filepath: The path to the file.
     :return: The hash of the file.
     """
-    md5sum = md5()
     with open(filepath, "rb") as source:
+        # file_digest runs the read loop in C straight off the fd
+        if file_digest is not None:
+            return file_digest(source, blake2b).hexdigest()
+        digest = blake2b()
         block = source.read(2**16)
         while len(block) != 0:
-            md5sum.update(block)
+            digest.update(block)
             block = source.read(2**16)
-    return md5sum.hexdigest()
+    return digest.hexdigest()
 
 
 def setup_luz_dir() -> Path:
     """Setup the tmp directory."""
     luz_dir = resolve_path(f"{resolve_path(cfg.luzconf_path).parent}/.luz")
-    if not luz_dir.exists():
-        mkdir(luz_dir)
+    makedirs(luz_dir, exist_ok=True)
 
     return luz_dir
 
 
+@lru_cache(maxsize=1)
+def _path_index() -> dict:
+    """Index every executable on the PATH with one scandir per directory.
+
+    :return: A mapping of executable names to their full paths, with earlier
+        PATH entries taking precedence."""
+    index = {}
+    for directory in environ.get("PATH", "").split(pathsep):
+        try:
+            with scandir(directory or ".") as entries:
+                for entry in entries:
+                    if entry.name not in index and entry.is_file() and access(entry.path, X_OK):
+                        index[entry.name] = entry.path
+        except OSError:
+            continue
+    return index
+
+
+@lru_cache(maxsize=512)
 def cmd_in_path(cmd: str) -> Union[None, Path]:
     """Check if a command is in the path.
 
+    Memoized, and backed by a one-shot index of every PATH directory so
+    probing N tools costs one directory scan each instead of N PATH walks.
+
     :param str cmd: The command to check.
     :return: The path to the command, or None if it's not in the path."""
+    if "/" not in str(cmd):
+        path = _path_index().get(str(cmd))
+        if path is not None:
+            return resolve_path(path)
     path = which(cmd)
 
     if path is None:
@@ -179,8 +219,7 @@ def cmd_in_path(cmd: str) -> Union[None, Path]:
 def get_luz_storage() -> str:
     """Gets the Luz storage directory."""
     storage_dir = resolve_path("$HOME/.luz")
-    if not storage_dir.exists():
-        mkdir(storage_dir)
+    makedirs(storage_dir, exist_ok=True)
     return storage_dir
 
 
@@ -1,3 +1,11 @@
+# control fields whose deb header isn't just the capitalized key
+field_names = {
+    "id": "Package",
+    "pre_depends": "Pre-Depends",
+    "original_maintainer": "Original-Maintainer",
+}
+
+
 class Control:
     def __init__(
         self,
@@ -84,35 +92,26 @@ class Control:
         :return: The control's string representation.
         :rtype: str
         """
-        # create string
-        string = ""
+        # collect the lines and join once
+        parts = []
         # loop through keys
-        for key in self.__dict__:
-            # raw
-            if key == "raw":
+        for key, value in self.__dict__.items():
+            # raw and unset fields
+            if key == "raw" or value is None:
                 continue
-            # get value
-            value = self.__dict__[key]
-            # check if value is not None
-            if value is not None:
-                # check for list
-                if isinstance(value, list):
-                    # check if list is not empty
-                    if value != []:
-                        value = ", ".join(value)
-                    else:
-                        continue
-                # check for bool
-                elif isinstance(value, bool):
-                    if value is False:
-                        continue
-                    value = "yes"
-
-                # check for id
-                if key == "id":
-                    string += f"Package: {value}\n"
-                # otherwise, just add to the control
-                else:
-                    string += f"{key.capitalize().replace('_', '-')}: {value}\n"
+            # check for list
+            if isinstance(value, list):
+                # check if list is not empty
+                if value == []:
+                    continue
+                value = ", ".join(value)
+            # check for bool
+            elif isinstance(value, bool):
+                if value is False:
+                    continue
+                value = "yes"
+            # look the header up, defaulting to the capitalized key
+            header = field_names.get(key, key.capitalize().replace("_", "-"))
+            parts.append(f"{header}: {value}\n")
         # return string
-        return string
+        return "".join(parts)
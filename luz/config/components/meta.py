@@ -1,12 +1,24 @@
 # module imports
+from functools import lru_cache
 from platform import platform as plat
-from subprocess import getoutput
+from subprocess import run
 
 # local imports
 from ...common.utils import cmd_in_path, get_luz_storage, resolve_path, setup_luz_dir
 from ...common import cfg
 
 
+@lru_cache(maxsize=8)
+def _xcrun_sdk(xcrun: str, platform: str) -> str:
+    """Ask xcrun for an SDK path, once per (xcrun, platform) per process.
+
+    :param str xcrun: Path to the xcrun executable.
+    :param str platform: The platform to look an SDK up for.
+    :return: The SDK path reported by xcrun.
+    """
+    return run([xcrun, "--show-sdk-path", "--sdk", platform], capture_output=True, text=True).stdout.strip()
+
+
 class Meta:
     def __init__(
         self,
@@ -118,29 +130,18 @@ class Meta:
                 raise Exception(f'Swift compiler "{self.swift}" not in prefix path.')
             self.swift = prefix_path
 
-        # format ldid with prefix
-        self.ldid = cmd_in_path(f'{(str(self.prefix) + "/") if self.prefix is not None else ""}ldid')
+        # find tools, preferring the prefix when one is set
+        self.ldid = self.__find_tool("ldid")
         if self.ldid is None:
-            # fall back to path
-            self.ldid = cmd_in_path("ldid")
-            if self.ldid is None:
-                raise Exception("Could not find ldid.")
+            raise Exception("Could not find ldid.")
 
-        # format ldid with prefix
-        self.strip = cmd_in_path(f'{(str(self.prefix) + "/") if self.prefix is not None else ""}strip')
+        self.strip = self.__find_tool("strip")
         if self.strip is None:
-            # fall back to path
-            self.strip = cmd_in_path("strip")
-            if self.strip is None:
-                raise Exception("Could not find strip.")
+            raise Exception("Could not find strip.")
 
-        # format lipo with prefix
-        self.lipo = cmd_in_path(f'{(str(self.prefix) + "/") if self.prefix is not None else ""}lipo')
+        self.lipo = self.__find_tool("lipo")
         if self.lipo is None:
-            # fall back to path
-            self.lipo = cmd_in_path("lipo")
-            if self.lipo is None:
-                raise Exception("Could not find lipo.")
+            raise Exception("Could not find lipo.")
 
         # attempt to manually find an sdk
         if self.sdk == "":
@@ -154,15 +155,26 @@ class Meta:
                 else:
                     raise Exception("Specified SDK does not exist.")
 
+    def __find_tool(self, name: str):
+        """Find a tool, preferring the configured prefix when one is set.
+
+        :param str name: The tool to look for.
+        :return: The path to the tool, or None if it could not be found.
+        """
+        if self.prefix != "":
+            tool = cmd_in_path(f"{self.prefix}/{name}")
+            if tool is not None:
+                return tool
+        return cmd_in_path(name)
+
     def __xcrun(self):
         xcrun = cmd_in_path("xcrun")
         if xcrun is None:
             raise Exception("xcrun not found.")
-        else:
-            sdkA = getoutput(f"{xcrun} --show-sdk-path --sdk {self.platform}").split("\n")[-1]
-            if sdkA == "" or not sdkA.startswith("/"):
-                raise Exception("Could not find an SDK.")
-            self.sdk = sdkA
+        sdkA = _xcrun_sdk(str(xcrun), self.platform)
+        if sdkA == "" or not sdkA.startswith("/"):
+            raise Exception("Could not find an SDK.")
+        self.sdk = sdkA
         return resolve_path(self.sdk)
 
     def __get_sdk(self):
@@ -178,14 +178,10 @@ class Module:
             if not f.exists():
                 raise FileNotFoundError(f'Bridging header "{f}" not found')
 
-        # resolve include dirs
-        self.include_dirs = [str(resolve_path(f).absolute()) for f in self.include_dirs]
-
-        # resolve framework dirs
-        self.framework_dirs = [str(resolve_path(f).absolute()) for f in self.framework_dirs]
-
-        # resolve library dirs
-        self.library_dirs = [str(resolve_path(f).absolute()) for f in self.library_dirs]
+        # resolve search dirs
+        self.include_dirs = self.__resolve_dirs(self.include_dirs)
+        self.framework_dirs = self.__resolve_dirs(self.framework_dirs)
+        self.library_dirs = self.__resolve_dirs(self.library_dirs)
 
         # add default values
         if self.type in default_values:
@@ -193,6 +189,22 @@ class Module:
                 # add keys in array to array
                 self.__dict__[key].extend(default_values[self.type][key])
 
+        # dedupe link inputs, preserving order; a framework listed both by the
+        # module and the defaults would otherwise be passed to clang twice
+        self.frameworks = list(dict.fromkeys(self.frameworks))
+        self.private_frameworks = list(dict.fromkeys(self.private_frameworks))
+        self.libraries = list(dict.fromkeys(self.libraries))
+        self.bridging_headers = list(dict.fromkeys(self.bridging_headers))
+
+    @staticmethod
+    def __resolve_dirs(dirs: list) -> list:
+        """Resolve a list of directories to absolute path strings.
+
+        :param list dirs: The directories to resolve.
+        :return: The resolved directories.
+        """
+        return [str(resolve_path(directory).absolute()) for directory in dirs]
+
     @property
     def abbreviated_name(self):
         if len(self.name) >= 3:
@@ -5,11 +5,11 @@ from argparse import Namespace
 from atexit import register
 from concurrent.futures import ThreadPoolExecutor
 from importlib.util import module_from_spec, spec_from_file_location
-from json import dump, loads
+from json import dump, load
 from multiprocessing import Lock
-from os import makedirs
+from os import cpu_count, makedirs, replace
 from pydeb import Control as pControl, Pack
-from shutil import copytree, rmtree
+from shutil import rmtree
 from sys import modules
 from time import time
 
@@ -17,13 +17,35 @@ from time import time
 from ..build.assign import assign
 from ..common.logger import log, warn
 from ..common.time import Ctime
-from ..common.utils import CMD, resolve_path, setup_luz_dir
+from ..common.utils import CMD, copy_tree, resolve_path, setup_luz_dir
 from ..common import cfg
 
 # import components
 from .components.control import Control
 from .components.meta import Meta
 
+# parsed build_info.json files keyed on stat metadata, so repeated Luz
+# instantiations over the same project (verify after build, shared
+# submodules) skip the JSON parse
+_build_info_cache = {}
+
+
+def _load_build_info(hash_file):
+    """Load a build_info.json, reusing the parse when the file is unchanged.
+
+    :param Path hash_file: Path to the build_info.json file.
+    """
+    if not hash_file.exists():
+        return {}
+    stat = hash_file.stat()
+    key = (str(hash_file), stat.st_mtime_ns, stat.st_size)
+    cached = _build_info_cache.get(key)
+    if cached is None:
+        with open(hash_file, "r") as file:
+            cached = load(file)
+        _build_info_cache[key] = cached
+    return cached
+
 
 class Luz:
     def __init__(self, file_path: str = "luzconf.py", args: Namespace = None, inherit=None):
@@ -77,8 +99,11 @@ class Luz:
         # import file
         self.raw = luz
 
-        # meta
-        self.meta = getattr(self.raw, "meta", Meta() if inherit is None else inherit.meta)
+        # meta; the default is built lazily — as a getattr default it would
+        # run the whole tool/SDK probe even when the config provides a meta
+        self.meta = getattr(self.raw, "meta", None)
+        if self.meta is None:
+            self.meta = Meta() if inherit is None else inherit.meta
 
         # inherit values
         if inherit is not None:
@@ -87,8 +112,9 @@ class Luz:
                 if value == "" or value is None or value == []:
                     setattr(self.meta, key, getattr(inherit.meta, key))
 
-        # pool
-        self.pool = ThreadPoolExecutor(max_workers=20) if inherit is None else inherit.pool
+        # pool; sized to the machine rather than a fixed count — the workers
+        # mostly wait on compiler subprocesses, so a couple per core saturates
+        self.pool = ThreadPoolExecutor(max_workers=(cpu_count() or 4) * 2) if inherit is None else inherit.pool
 
         # lock
         self.lock = Lock() if inherit is None else inherit.lock
@@ -156,13 +182,8 @@ class Luz:
         if inherit is not None:
             self.build_info = getattr(inherit, "build_info")
         else:
-            hash_file = resolve_path(f"{self.build_dir}/build_info.json")
             # check if hashlist exists
-            if hash_file.exists():
-                with open(hash_file, "r") as file:
-                    self.build_info = loads(file.read())
-            else:
-                self.build_info = {}
+            self.build_info = _load_build_info(resolve_path(f"{self.build_dir}/build_info.json"))
 
         if self.meta.debug and self.meta.pack:
             # get build number
@@ -179,9 +200,9 @@ class Luz:
             else:
                 self.build_number = getattr(inherit, "build_number")
 
-        # assign submodules
-        submodules = self.pool.map(self.__assign_submodule, self.submodules)
-        self.submodules = submodules
+        # assign submodules; materialized so they can be sized and iterated
+        # more than once (build fan-out, then pack's layout pass)
+        self.submodules = list(self.pool.map(self.__assign_submodule, self.submodules))
 
     def __assign_passed_value(self, value):
         """Assign a key from the passed config."""
@@ -221,15 +242,16 @@ class Luz:
         else:
             dir_to_log = str(self.path.absolute()).replace(str(self.path.cwd().absolute()), ".")
         log(f"Packing to '{dir_to_log}/packages/{deb_file_name}'...", "📦")
-        # layout
+        # layout; hardlinked into the staging tree — the layouts aren't
+        # mutated, so there's no reason to duplicate their bytes
         layout_path = resolve_path("layout")
         if layout_path.exists():
-            copytree(layout_path, self.meta.root_dir, dirs_exist_ok=True)
+            copy_tree(layout_path, self.meta.root_dir, hardlink=True)
         # submodule layout paths
         for submodule in self.submodules:
             layout_path = resolve_path(f"{submodule.path}/layout")
             if layout_path.exists():
-                copytree(layout_path, self.meta.root_dir, dirs_exist_ok=True)
+                copy_tree(layout_path, self.meta.root_dir, hardlink=True)
         # makedirs
         makedirs(f"{self.meta.staging_dir}/DEBIAN", exist_ok=True)
         # add control
@@ -248,8 +270,16 @@ class Luz:
 
     def __build(self):
         """Build the project."""
-        # assign modules
-        mod_map = [assign(m, self) for m in self.modules]
+        # kick submodules off first so they overlap with this project's own
+        # modules instead of waiting for them. They get dedicated threads: a
+        # shared-pool worker waiting on compile tasks queued behind it would
+        # starve the pool outright on small machines
+        submodule_pool = ThreadPoolExecutor(max_workers=len(self.submodules)) if self.submodules else None
+        submodule_futures = [submodule_pool.submit(lambda sub=sub: sub.__build()) for sub in self.submodules]
+
+        # assign modules, largest file count first; the modules are
+        # independent, so longest-job-first keeps the schedule tail short
+        mod_map = [assign(m, self) for m in sorted(self.modules, key=lambda m: len(m.files), reverse=True)]
 
         # build modules
         results = self.pool.map(lambda m: m.compile(), mod_map)
@@ -258,10 +288,14 @@ class Luz:
                 return result
 
         # submodule results
-        submodule_results = self.pool.map(lambda s: s.__build(), self.submodules)
-        for result in submodule_results:
-            if result is not None:
-                return result
+        try:
+            for future in submodule_futures:
+                result = future.result()
+                if result is not None:
+                    return result
+        finally:
+            if submodule_pool is not None:
+                submodule_pool.shutdown(wait=False)
 
     def build_project(self):
         """Build the project."""
@@ -274,8 +308,12 @@ class Luz:
         if self.meta.pack:
             self.__pack()
 
-        with open(resolve_path(f"{self.build_dir}/build_info.json"), "w") as file:
+        # write the hashfile atomically so an interrupted build can't leave a
+        # truncated file behind and force a cold rebuild
+        info_path = f"{self.build_dir}/build_info.json"
+        with open(f"{info_path}.tmp", "w") as file:
             dump(self.build_info, file)
+        replace(f"{info_path}.tmp", info_path)
 
         t = time() - self.now
         log(f"Build completed in {round(t, 2)} seconds.{f' ({Ctime(t).get_random()})' if self.funny_time else ''}")